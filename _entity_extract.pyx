@@ -0,0 +1,28 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Cython fast path for the per-match person emit loop.
+
+The regex work is already minimal after the pure-Python optimizations;
+what remains in the inner loop is record construction and dedupe-set
+bookkeeping, which is bytecode-dispatch bound in CPython. Compiling this
+loop removes that dispatch. Build in place with:
+
+    cythonize -3 -i _entity_extract.pyx
+
+The Python layer falls back to its own loop when the compiled module is
+absent, so building is optional.
+"""
+
+
+def extract_person_tuples(pattern, str text):
+    """Return deduped (name, age, company, position) tuples for each match."""
+    cdef set seen = set()
+    cdef list out = []
+    for m in pattern.finditer(text):
+        name = m.group("p_name")
+        if name in seen:
+            continue
+        seen.add(name)
+        out.append(
+            (name, int(m.group("p_age")), m.group("p_company"), m.group("p_position"))
+        )
+    return out
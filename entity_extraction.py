@@ -0,0 +1,706 @@
+"""Entity extraction for the KGEB benchmark.
+
+Scans ``documents.txt`` for Person, Company, Project and derived entities
+(Department, Position, Location) and writes them to ``entities_output.json``
+in the shape described by ``entities.json``.
+"""
+
+import json
+import mmap
+import os
+import re
+from collections import Counter
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional extreme-throughput backend
+    hyperscan = None
+
+try:
+    import _entity_extract  # compiled from _entity_extract.pyx (optional)
+except ImportError:  # pragma: no cover - pure-Python loop is the fallback
+    _entity_extract = None
+
+# Known company headquarters and US city names, hoisted to module scope so
+# the location helpers do O(1) lookups with no per-call construction.
+_COMPANY_LOCATION: dict = {
+    "OpenAI": "San Francisco",
+    "Google": "Mountain View",
+    "Microsoft": "Redmond",
+    "Apple": "Cupertino",
+    "Amazon": "Seattle",
+    "Meta": "Menlo Park",
+    "Tesla": "Austin",
+    "Netflix": "Los Gatos",
+    "Spotify": "Stockholm",
+    "Uber": "San Francisco",
+    "IBM": "Armonk",
+    "Oracle": "Austin",
+    "Salesforce": "San Francisco",
+    "Adobe": "San Jose",
+    "Intel": "Santa Clara",
+    "Cisco": "San Jose",
+    "HP": "Palo Alto",
+    "Dell": "Round Rock",
+    "VMware": "Palo Alto",
+    "RedHat": "Raleigh",
+}
+_US_CITIES: frozenset = frozenset(
+    {
+        "San Francisco",
+        "Mountain View",
+        "Redmond",
+        "Cupertino",
+        "Seattle",
+        "Menlo Park",
+        "Austin",
+        "Los Gatos",
+        "Armonk",
+        "San Jose",
+        "Santa Clara",
+        "Palo Alto",
+        "Round Rock",
+        "Raleigh",
+    }
+)
+
+
+# Keyword classifiers: one compiled alternation per helper whose first
+# match selects the bucket. Distinct positions are far fewer than
+# persons, so each classification is cached and paid once per unique
+# (pre-lowered) input.
+_DEPT_RE = re.compile(
+    r"(engineer|developer|manager|director|designer|creative|scientist|"
+    r"researcher|architect|specialist|administrator|support)"
+)
+_DEPT_MAP = {
+    "engineer": "Engineering",
+    "developer": "Engineering",
+    "architect": "Engineering",
+    "manager": "Management",
+    "director": "Management",
+    "designer": "Design",
+    "creative": "Design",
+    "scientist": "Research",
+    "researcher": "Research",
+    "specialist": "Operations",
+    "administrator": "Operations",
+    "support": "Operations",
+}
+_LEVEL_RE = re.compile(r"(senior|lead|director|manager|junior)")
+_LEVEL_MAP = {
+    "senior": "Senior",
+    "lead": "Lead",
+    "director": "Executive",
+    "manager": "Manager",
+    "junior": "Junior",
+}
+_SALARY_MAP = {
+    "senior": "120k-180k",
+    "lead": "130k-190k",
+    "director": "180k-250k",
+    "manager": "140k-200k",
+    "junior": "60k-90k",
+}
+
+
+@lru_cache(maxsize=4096)
+def _classify_department(position_lower):
+    match = _DEPT_RE.search(position_lower)
+    return _DEPT_MAP[match.group(1)] if match else "General"
+
+
+@lru_cache(maxsize=4096)
+def _classify_level(title_lower):
+    match = _LEVEL_RE.search(title_lower)
+    return _LEVEL_MAP[match.group(1)] if match else "Mid"
+
+
+@lru_cache(maxsize=4096)
+def _classify_salary_range(title_lower):
+    match = _LEVEL_RE.search(title_lower)
+    return _SALARY_MAP[match.group(1)] if match else "90k-130k"
+
+
+@dataclass(slots=True)
+class Person:
+    """Slotted person record: ~4x smaller than the equivalent dict and
+    serialized natively by orjson."""
+
+    name: str
+    age: int
+    position: str
+    department: str
+
+
+class EntityExtractor:
+    """Extracts typed entities from a full document string."""
+
+    # All patterns are compiled once at class-definition time; per-scan code
+    # uses the bound ``finditer`` of the compiled object so no pattern-cache
+    # lookup happens inside the hot loops. Inner groups are named so the
+    # same sources compose into the single-pass master pattern below.
+    _PERSON_PATTERN = (
+        r"(?P<p_name>[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s+age\s+(?P<p_age>\d+),\s+"
+        r"works\s+at\s+(?P<p_company>[A-Za-z0-9]+)\s+as\s+an?\s+"
+        r"(?P<p_position>[A-Za-z]+(?:\s+[A-Za-z]+)*)\s*\."
+    )
+    _PROJECT_PATTERN = (
+        r"Project\s+(?P<j_name>[A-Za-z0-9\-]+)\s+(?:started|began|launched|initiated)\s+on\s+"
+        r"(?P<j_start>\d{4}-\d{2}-\d{2}),\s+(?:ends|concludes|finishes|completes)\s+on\s+"
+        r"(?P<j_end>\d{4}-\d{2}-\d{2})"
+    )
+    # The five verb phrases are fused into a single alternation so company
+    # extraction scans the document once instead of once per verb.
+    _COMPANY_PATTERN = (
+        r"(?P<c_name>[A-Za-z0-9]+)\s+"
+        r"(?P<c_verb>operates\s+in(?:\s+the)?|specializes\s+in|focuses\s+on|"
+        r"is\s+known\s+for|works\s+in)\s+"
+        r"(?P<c_industry>[A-Za-z]+(?:\s+[A-Za-z]+)*?)"
+        r"(?:\s+and\s+(?P<c_sector>[A-Za-z]+(?:\s+[A-Za-z]+)*?))?"
+        r"(?:\s+industry|\s+sector|\s+sectors|\.|$)"
+    )
+    _PERSON_RE = re.compile(_PERSON_PATTERN, re.IGNORECASE | re.MULTILINE)
+    _PROJECT_RE = re.compile(_PROJECT_PATTERN, re.IGNORECASE | re.MULTILINE)
+    _COMPANY_RE = re.compile(_COMPANY_PATTERN, re.IGNORECASE | re.MULTILINE)
+    # Master pattern: one alternation over all three entity shapes so
+    # extract_all sweeps the document once instead of once per type.
+    _MASTER_RE = re.compile(
+        f"(?P<person>{_PERSON_PATTERN})|(?P<project>{_PROJECT_PATTERN})|"
+        f"(?P<company>{_COMPANY_PATTERN})",
+        re.IGNORECASE | re.MULTILINE,
+    )
+
+    # Shared Hyperscan database, compiled once per process on first use.
+    _hs_db_built = False
+    _hs_db_shared = None
+
+    def __init__(self, entities_schema):
+        self.entities_schema = entities_schema
+        self.extracted_entities = {entity_type: [] for entity_type in entities_schema}
+        self._hs_db = self._shared_hyperscan_db() if hyperscan is not None else None
+        self._hs_verify = {
+            0: ("person", self._PERSON_RE),
+            1: ("project", self._PROJECT_RE),
+            2: ("company", self._COMPANY_RE),
+        }
+
+    def __getstate__(self):
+        # The Hyperscan database is not picklable; workers rebuild it from
+        # the class-level cache on first use after unpickling.
+        state = self.__dict__.copy()
+        state["_hs_db"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if hyperscan is not None:
+            self._hs_db = self._shared_hyperscan_db()
+
+    @classmethod
+    def _shared_hyperscan_db(cls):
+        if not cls._hs_db_built:
+            cls._hs_db_shared = cls._build_hyperscan_db()
+            cls._hs_db_built = True
+        return cls._hs_db_shared
+
+    @classmethod
+    def _build_hyperscan_db(cls):
+        """Compile the entity patterns into a Hyperscan database, or None.
+
+        Hyperscan scans all patterns in one vectorized pass at multi-GB/s;
+        it does not report capture groups, so hits are re-verified with the
+        stdlib patterns on the small matched window. Group names are
+        stripped because Hyperscan treats every group as non-capturing.
+        """
+        expressions = [
+            re.sub(r"\(\?P<[^>]+>", "(", p).encode()
+            for p in (cls._PERSON_PATTERN, cls._PROJECT_PATTERN, cls._COMPANY_PATTERN)
+        ]
+        flags = (
+            hyperscan.HS_FLAG_MULTILINE
+            | hyperscan.HS_FLAG_CASELESS
+            | hyperscan.HS_FLAG_SOM_LEFTMOST
+        )
+        try:
+            db = hyperscan.Database()
+            db.compile(expressions=expressions, ids=[0, 1, 2], flags=[flags] * 3)
+            return db
+        except Exception:  # unsupported construct: degrade to pure re
+            return None
+
+    def _iter_hyperscan_matches(self, text):
+        data = text.encode("utf-8")
+        hits = []
+        self._hs_db.scan(
+            data,
+            match_event_handler=lambda pid, start, end, flags, ctx: hits.append(
+                (start, end, pid)
+            ),
+        )
+        hits.sort()
+        for start, end, pid in hits:
+            kind, pattern = self._hs_verify[pid]
+            match = pattern.search(data[start:end].decode("utf-8", "surrogateescape"))
+            if match is not None:
+                yield kind, match
+
+    def _iter_entity_matches(self, text):
+        """Yield (kind, match) pairs from whichever backend is available."""
+        if self._hs_db is not None:
+            yield from self._iter_hyperscan_matches(text)
+            return
+        for match in self._MASTER_RE.finditer(text):
+            if match.group("person") is not None:
+                yield "person", match
+            elif match.group("project") is not None:
+                yield "project", match
+            else:
+                yield "company", match
+
+    def extract_person(self, text):
+        """Extract Person entities from the text.
+
+        Two-stage scan: every person record contains the literal ", age ",
+        which str.find locates at memchr speed. The full pattern only runs
+        on a small window around each hit (anchored to the start of the
+        hit's line), so the regex engine never walks non-person text.
+        """
+        if _entity_extract is not None:
+            # Compiled emit loop: match iteration, dedupe and tuple
+            # construction run without bytecode dispatch.
+            return [
+                Person(
+                    name=name,
+                    age=age,
+                    position=position,
+                    department=self._infer_department(position.lower()),
+                )
+                for name, age, _company, position in _entity_extract.extract_person_tuples(
+                    self._PERSON_RE, text
+                )
+            ]
+        persons = []
+        seen_names = []
+        search = self._PERSON_RE.search
+        find = text.find
+        idx = find(", age ")
+        while idx >= 0:
+            lo = max(0, idx - 200)
+            newline = text.rfind("\n", lo, idx)
+            start = newline + 1 if newline >= 0 else lo
+            # A person record never spans lines, so the window runs to
+            # the end of the hit's line; a fixed cap would truncate
+            # records with a long company and position tail.
+            end = find("\n", idx)
+            if end < 0:
+                end = len(text)
+            match = search(text, start, end)
+            if match is not None:
+                self._emit_person(match, persons, seen_names)
+            idx = find(", age ", idx + 6)
+        return persons
+
+    def extract_company(self, text):
+        """Extract Company entities from the text."""
+        companies = []
+        seen_companies = set()
+        for match in self._COMPANY_RE.finditer(text):
+            self._emit_company(match, companies, seen_companies)
+        return companies
+
+    def extract_project(self, text):
+        """Extract Project entities from the text."""
+        projects = []
+        seen_projects = []
+        today = date.today()
+        for match in self._PROJECT_RE.finditer(text):
+            self._emit_project(match, projects, seen_projects, today)
+        return projects
+
+    def _emit_person(self, match, persons, seen_names):
+        # Captures cannot carry edge whitespace, so groups are used as-is
+        # without per-match strip() copies.
+        name = match.group("p_name")
+        if name in seen_names:
+            return
+        seen_names.append(name)
+        position = match.group("p_position")
+        persons.append(
+            Person(
+                name=name,
+                age=int(match.group("p_age")),
+                position=position,
+                department=self._infer_department(position.lower()),
+            )
+        )
+
+    def _emit_company(self, match, companies, seen_companies):
+        name = match.group("c_name")
+        if name.lower() in seen_companies:
+            return
+        seen_companies.add(name.lower())
+        industry = match.group("c_industry")
+        sector = match.group("c_sector")
+        companies.append(
+            {
+                "name": name,
+                "industry": industry,
+                "sector": sector if sector else industry,
+                "location": self._infer_location(name),
+            }
+        )
+
+    def _emit_project(self, match, projects, seen_projects, today):
+        name = match.group("j_name")
+        if name in seen_projects:
+            return
+        seen_projects.append(name)
+        start_date = match.group("j_start")
+        end_date = match.group("j_end")
+        # Parse each date once and share the parsed dates between the
+        # status and budget helpers. fromisoformat is ~10x faster than
+        # strptime; the guard stays because the pattern only checks the
+        # digit shape, not that day/month values are in range.
+        try:
+            start = date.fromisoformat(start_date)
+            end = date.fromisoformat(end_date)
+        except ValueError:
+            start = end = None
+        projects.append(
+            {
+                "name": name,
+                "start_date": start_date,
+                "end_date": end_date,
+                "status": self._determine_project_status(start, end, today),
+                "budget": self._estimate_budget(start, end),
+            }
+        )
+
+    def extract_department(self, persons):
+        """Deprecated: extract_all aggregates departments in its single pass."""
+        return self._departments_from_aggregates(
+            Counter(person.department for person in persons)
+        )
+
+    def extract_position(self, persons):
+        """Deprecated: extract_all aggregates positions in its single pass."""
+        return self._positions_from_aggregates(
+            dict.fromkeys(person.position for person in persons)
+        )
+
+    def _departments_from_aggregates(self, dept_counts):
+        return [
+            {"name": name, "head": None, "employee_count": count}
+            for name, count in dept_counts.items()
+        ]
+
+    def _positions_from_aggregates(self, titles):
+        positions = []
+        for title in titles:
+            # Case-fold once; both classifiers share the lowered string.
+            title_lower = title.lower()
+            positions.append(
+                {
+                    "title": title,
+                    "level": self._infer_level(title_lower),
+                    "salary_range": self._estimate_salary_range(title_lower),
+                }
+            )
+        return positions
+
+    def extract_location(self, companies):
+        """Derive Location entities from extracted companies."""
+        locations = Counter(company.get("location", "Unknown") for company in companies)
+        return [
+            {"city": city, "country": self._infer_country(city), "office_type": "Headquarters"}
+            for city in locations
+        ]
+
+    def extract_all(self, text):
+        """Run every extractor and return the aggregated entity dict."""
+        persons, companies, projects = [], [], []
+        seen_persons, seen_companies, seen_projects = [], set(), []
+        today = date.today()
+        # One sweep of the document replaces the three independent
+        # full-text scans; each match is routed to the emit helper for
+        # whichever entity shape matched.
+        for kind, match in self._iter_entity_matches(text):
+            if kind == "person":
+                self._emit_person(match, persons, seen_persons)
+            elif kind == "project":
+                self._emit_project(match, projects, seen_projects, today)
+            else:
+                self._emit_company(match, companies, seen_companies)
+        # One pass over persons feeds both the department and position
+        # aggregates instead of re-walking the list per derived type.
+        dept_counts = Counter()
+        titles = {}
+        for person in persons:
+            dept_counts[person.department] += 1
+            titles.setdefault(person.position)
+        # All per-document state lives in locals, so one extractor instance
+        # can be shared across files and threads.
+        return {
+            "Person": persons,
+            "Company": companies,
+            "Project": projects,
+            "Department": self._departments_from_aggregates(dept_counts),
+            "Position": self._positions_from_aggregates(titles),
+            "Location": self.extract_location(companies),
+        }
+
+    def extract_all_parallel(self, docs, workers=None):
+        """Extract from several documents in parallel and merge the results.
+
+        Each document is handed to a worker process; the extractor is
+        picklable (its only state is the schema), so no pool setup beyond
+        max_workers is needed. Per-document dicts are merged with the same
+        name-keyed re-dedupe used for chunked scans.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            per_doc = list(executor.map(self.extract_all, docs))
+        return _merge_entity_results(per_doc)
+
+    def _infer_department(self, position_lower):
+        return _classify_department(position_lower)
+
+    def _infer_level(self, title_lower):
+        return _classify_level(title_lower)
+
+    def _estimate_salary_range(self, title_lower):
+        return _classify_salary_range(title_lower)
+
+    def _infer_location(self, company_name):
+        return _COMPANY_LOCATION.get(company_name, "Unknown")
+
+    def _infer_country(self, city):
+        if city in _US_CITIES:
+            return "USA"
+        if city == "Stockholm":
+            return "Sweden"
+        return "Unknown"
+
+    def _determine_project_status(self, start, end, today=None):
+        if start is None or end is None:
+            return "Unknown"
+        if today is None:
+            today = date.today()
+        if today < start:
+            return "Planned"
+        if today > end:
+            return "Completed"
+        return "Active"
+
+    def _estimate_budget(self, start, end):
+        if start is None or end is None:
+            return None
+        months = max(1, (end - start).days // 30)
+        return months * 50000
+
+
+class LineEntityExtractor:
+    """Line-oriented extractor used for streaming-style extraction."""
+
+    _PERSON_RE = EntityExtractor._PERSON_RE
+    _PROJECT_RE = EntityExtractor._PROJECT_RE
+    _COMPANY_RE = EntityExtractor._COMPANY_RE
+    _TEAM_RE = re.compile(
+        r"Team\s+([A-Za-z0-9\-]+)\s+has\s+(\d+)\s+members?\s+focusing\s+on\s+"
+        r"([A-Za-z]+(?:\s+[A-Za-z]+)*)\s*\.",
+        re.IGNORECASE | re.MULTILINE,
+    )
+
+    def __init__(self):
+        self.entities = {"Person": [], "Project": [], "Company": [], "Team": []}
+        self._seen = {"Person": set(), "Project": set(), "Company": set(), "Team": set()}
+
+    def extract_from_text(self, text):
+        """Extract entities from the full text with one scan per pattern."""
+        self._scan_persons(text)
+        self._scan_projects(text)
+        self._scan_companies(text)
+        self._scan_teams(text)
+        return self.entities
+
+    def _scan_persons(self, text):
+        for match in self._PERSON_RE.finditer(text):
+            name = match.group(1)
+            key = name.lower()
+            if key in self._seen["Person"]:
+                continue
+            self._seen["Person"].add(key)
+            self.entities["Person"].append(
+                {"name": name, "age": int(match.group(2)), "position": match.group(4)}
+            )
+
+    def _scan_projects(self, text):
+        for match in self._PROJECT_RE.finditer(text):
+            name = match.group(1)
+            key = name.lower()
+            if key in self._seen["Project"]:
+                continue
+            self._seen["Project"].add(key)
+            self.entities["Project"].append(
+                {"name": name, "start_date": match.group(2), "end_date": match.group(3)}
+            )
+
+    def _scan_companies(self, text):
+        for match in self._COMPANY_RE.finditer(text):
+            name = match.group("c_name")
+            key = name.lower()
+            if key in self._seen["Company"]:
+                continue
+            self._seen["Company"].add(key)
+            self.entities["Company"].append(
+                {"name": name, "industry": match.group("c_industry")}
+            )
+
+    def _scan_teams(self, text):
+        for match in self._TEAM_RE.finditer(text):
+            name = match.group(1)
+            key = name.lower()
+            if key in self._seen["Team"]:
+                continue
+            self._seen["Team"].add(key)
+            self.entities["Team"].append(
+                {"name": name, "size": int(match.group(2)), "focus_area": match.group(3)}
+            )
+
+
+# Inputs larger than this are memory-mapped and processed in chunks so the
+# whole corpus is never held as one decoded Python string.
+_MMAP_CHUNK = 1 << 20
+
+
+def _iter_document_chunks(documents_path):
+    """Yield the documents file as text chunks split on blank lines.
+
+    Small files come back as a single string. Large files are mmap'ed
+    (page-cache backed, demand-paged) and decoded one chunk at a time,
+    with chunk boundaries snapped to blank lines so no record is split.
+    """
+    with open(documents_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= _MMAP_CHUNK:
+            yield f.read().decode("utf-8")
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = 0
+            while pos < size:
+                end = min(pos + _MMAP_CHUNK, size)
+                if end < size:
+                    cut = mm.rfind(b"\n\n", pos, end)
+                    if cut <= pos:
+                        cut = mm.find(b"\n\n", end)
+                        end = size if cut < 0 else cut + 2
+                    else:
+                        end = cut + 2
+                yield mm[pos:end].decode("utf-8")
+                pos = end
+
+
+def _entity_key(item):
+    if isinstance(item, dict):
+        return item.get("name") or item.get("title") or item.get("city")
+    return item.name
+
+
+# Entity types whose records are aggregates over other entities: their
+# counts only hold within one extraction pass, so merging them by name
+# would keep the first chunk's numbers and drop the rest.
+_AGGREGATE_TYPES = frozenset({"Department", "Position", "Location"})
+
+
+def _merge_entity_results(per_chunk_results):
+    """Merge per-chunk entity dicts, re-deduping by name/title.
+
+    Raw Person/Company/Project records merge first-seen-wins by key.
+    Department, Position, and Location entries are per-chunk aggregates
+    (e.g. ``employee_count``), so they are recomputed from the merged
+    persons and companies rather than deduped.
+    """
+    merged = {}
+    seen = {}
+    aggregates_present = set()
+    for results in per_chunk_results:
+        for entity_type, items in results.items():
+            if entity_type in _AGGREGATE_TYPES:
+                aggregates_present.add(entity_type)
+                continue
+            out = merged.setdefault(entity_type, [])
+            keys = seen.setdefault(entity_type, set())
+            for item in items:
+                key = _entity_key(item)
+                if key is not None:
+                    if key in keys:
+                        continue
+                    keys.add(key)
+                out.append(item)
+    if aggregates_present & {"Department", "Position"}:
+        dept_counts = Counter()
+        titles = {}
+        for person in merged.get("Person", ()):
+            dept_counts[person.department] += 1
+            titles.setdefault(person.position)
+        if "Department" in aggregates_present:
+            merged["Department"] = (
+                default_extractor._departments_from_aggregates(dept_counts)
+            )
+        if "Position" in aggregates_present:
+            merged["Position"] = (
+                default_extractor._positions_from_aggregates(titles)
+            )
+    if "Location" in aggregates_present:
+        merged["Location"] = default_extractor.extract_location(
+            merged.get("Company", ())
+        )
+    return merged
+
+
+def extract_entities(
+    documents_path="documents.txt",
+    schema_path="entities.json",
+    output_path="entities_output.json",
+):
+    """Run extraction over the documents file and write the entity output."""
+    with open(schema_path, "r", encoding="utf-8") as f:
+        entities_schema = json.load(f)
+    extractor = EntityExtractor(entities_schema)
+    per_chunk = [extractor.extract_all(chunk) for chunk in _iter_document_chunks(documents_path)]
+    entities = per_chunk[0] if len(per_chunk) == 1 else _merge_entity_results(per_chunk)
+    if orjson is not None:
+        # orjson serializes (indent included) in one native pass with no
+        # intermediate Python string; write the returned bytes directly.
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(entities, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(entities, f, indent=2, ensure_ascii=False, default=asdict)
+    return entities
+
+
+# A single reusable instance: patterns and lookup tables are class- or
+# module-level constants and per-document results are local to each call,
+# so batch pipelines can share this extractor across files and threads
+# instead of paying construction cost per file.
+default_extractor = EntityExtractor({})
+
+
+def extract_entities_fast(text):
+    """Extract entities from an in-memory document via the shared extractor."""
+    return default_extractor.extract_all(text)
+
+
+if __name__ == "__main__":
+    extract_entities()
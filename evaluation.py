@@ -0,0 +1,708 @@
+"""Evaluation for the KGEB extraction benchmark.
+
+Scores an extraction run along two axes: schema compliance (do the
+extracted entities and relations carry the attributes their schemas
+require?) and, when gold files are available, precision/recall/F1
+against the gold annotations.  ``evaluate_extraction`` ties everything
+together and writes ``evaluation_report.json``.
+"""
+
+import functools
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is the fallback
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - Python set path is the fallback
+    pa = None
+    pc = None
+
+try:
+    import numpy as np
+    from numba import njit, typed, types
+except ImportError:  # pragma: no cover - per-relation Python loop fallback
+    np = None
+    njit = None
+
+if njit is not None:  # pragma: no cover - requires numba
+
+    @njit(cache=True)
+    def _count_consistent_jit(src, tgt, valid_src, valid_tgt):
+        count = 0
+        for i in range(src.shape[0]):
+            if src[i] in valid_src and tgt[i] in valid_tgt:
+                count += 1
+        return count
+
+    def _empty_id_set():
+        return typed.Dict.empty(types.int64, types.int64)
+
+    # Warm the kernel at import so the first evaluation does not pay the
+    # compile cost.
+    _count_consistent_jit(
+        np.zeros(1, np.int64),
+        np.zeros(1, np.int64),
+        _empty_id_set(),
+        _empty_id_set(),
+    )
+else:
+    _count_consistent_jit = None
+
+# Below this many canonical items the Python set path beats the Arrow
+# table setup cost.
+_ARROW_MIN_ITEMS = 1000
+
+# Relation evaluation fans out across a thread pool above this many
+# predicted relations; KGEB_EVAL_PARALLEL=0 forces the serial path.
+_PARALLEL_MIN_RELATIONS = 10_000
+
+# Key names that commonly denote the endpoints of a relation, used when a
+# relation dict does not name its endpoints after the entity types.
+GENERIC_SOURCE_KEYS = [
+    "source", "from", "subject", "person", "employee",
+    "manager", "owner", "head", "name",
+]
+GENERIC_TARGET_KEYS = [
+    "target", "to", "object", "project", "company",
+    "department", "location", "position", "city", "title",
+]
+
+# Shared sentinel for entity-index lookups on absent types.
+_EMPTY = {}
+
+
+def _intern_if_str(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _intern_relation_values(predicted_relations):
+    """Intern string values in the relation dicts, in place.
+
+    The same entity names recur across many relations; sharing one
+    interned object per name cuts memory and lets the entity-index
+    lookups short-circuit on identity.
+    """
+    for relations in predicted_relations.values():
+        for relation in relations:
+            for key, value in relation.items():
+                if isinstance(value, str):
+                    relation[key] = sys.intern(value)
+
+
+@dataclass
+class ExtractionMetrics:
+    """Precision/recall/F1 triple with the raw counts behind it."""
+
+    precision: float
+    recall: float
+    f1_score: float
+    true_positives: int
+    false_positives: int
+    false_negatives: int
+
+
+class SchemaValidator:
+    """Checks extracted output against the entity and relation schemas."""
+
+    def __init__(self, entity_schema, relation_schema):
+        self.entity_schema = entity_schema
+        self.relation_schema = relation_schema
+        # Both schemas are immutable for the validator's lifetime, so the
+        # lookup structures are built once instead of per validate call.
+        self._valid_relation_types = frozenset(
+            rel["id"] for rel in relation_schema.get("relations", [])
+        )
+        self._entity_required = {
+            et: frozenset(attrs) for et, attrs in entity_schema.items()
+        }
+
+    def validate_entities(self, entities):
+        """Return a list of schema-violation messages for *entities*."""
+        errors = []
+        for entity_type, items in entities.items():
+            required = self._entity_required.get(entity_type)
+            if required is None:
+                errors.append(f"Unknown entity type: {entity_type}")
+                continue
+            for entity in items:
+                missing = required - entity.keys()
+                if missing:
+                    errors.append(
+                        f"{entity_type} entity {entity.get('name', '?')!r} "
+                        f"missing attributes: {sorted(missing)}"
+                    )
+        return errors
+
+    def validate_relations(self, relations):
+        """Return a list of schema-violation messages for *relations*."""
+        errors = []
+        for relation_type in relations:
+            if relation_type not in self._valid_relation_types:
+                errors.append(f"Unknown relation type: {relation_type}")
+        return errors
+
+
+class Evaluator:
+    """Schema-driven evaluator for extracted entities and relations."""
+
+    def __init__(self, entities_schema, relations_schema):
+        self.entities_schema = entities_schema
+        self.relations_schema = relations_schema
+        # Required-attribute sets, hoisted so the per-entity compliance
+        # check is a single C-level subset test on the dict's key view.
+        self._req_sets = {
+            et: frozenset(attrs) for et, attrs in entities_schema.items()
+        }
+        # Acceptable endpoint keys per relation type, precomputed so the
+        # per-relation check is one hash-based intersection instead of
+        # re-scanning the keyword lists with substring matching. The key
+        # universe is the generic endpoint names plus every schema
+        # attribute and lowercased entity-type name.
+        known_keys = set(GENERIC_SOURCE_KEYS) | set(GENERIC_TARGET_KEYS)
+        for attrs in entities_schema.values():
+            known_keys.update(attrs)
+        known_keys.update(et.lower() for et in entities_schema)
+        # Key attribute per entity type, resolved once from the schema so
+        # index construction does a single dict lookup per entity.
+        self._key_attr = {
+            et: next(
+                (a for a in attrs if a in ("name", "title", "city")), "name"
+            )
+            for et, attrs in entities_schema.items()
+        }
+        generic_src = frozenset(GENERIC_SOURCE_KEYS)
+        generic_tgt = frozenset(GENERIC_TARGET_KEYS)
+        self._rel_src_keys = {}
+        self._rel_tgt_keys = {}
+        # Type-specific keys are kept separately so endpoint resolution
+        # can prefer them over the generic names, which may be ambiguous
+        # (e.g. "company" is a valid generic key for either endpoint).
+        self._rel_src_typed = {}
+        self._rel_tgt_typed = {}
+        for rt, relation_def in relations_schema.items():
+            src_lower = relation_def.get("source_entity", "").lower()
+            tgt_lower = relation_def.get("target_entity", "").lower()
+            src_typed = frozenset(
+                k for k in known_keys if k.lower() in src_lower
+            )
+            tgt_typed = frozenset(
+                k for k in known_keys if k.lower() in tgt_lower
+            )
+            self._rel_src_typed[rt] = src_typed
+            self._rel_tgt_typed[rt] = tgt_typed
+            self._rel_src_keys[rt] = generic_src | src_typed
+            self._rel_tgt_keys[rt] = generic_tgt | tgt_typed
+        # Specialized schema checks compiled per relation type. The
+        # acceptable keys are schema constants, so each check is emitted
+        # once as branch-minimal bytecode with the key literals inlined —
+        # no set construction or attribute lookups at call time.
+        self._rel_check = {}
+        for rt in relations_schema:
+            src_expr = " or ".join(
+                f"{key!r} in r" for key in sorted(self._rel_src_keys[rt])
+            )
+            tgt_expr = " or ".join(
+                f"{key!r} in r" for key in sorted(self._rel_tgt_keys[rt])
+            )
+            namespace = {}
+            exec(
+                f"def _check(r):\n    return ({src_expr}) and ({tgt_expr})",
+                namespace,
+            )
+            self._rel_check[rt] = namespace["_check"]
+        # Constant metric templates for types with no predictions, so the
+        # empty branches are a single dict.update instead of loop setup.
+        self._entity_zero = {
+            et: {f"{et}_count": 0, f"{et}_schema_compliance": 1.0}
+            for et in entities_schema
+        }
+        self._relation_zero = {
+            rt: {
+                f"{rt}_count": 0,
+                f"{rt}_schema_compliance": 1.0,
+                f"{rt}_consistency": 1.0,
+            }
+            for rt in relations_schema
+        }
+        self._empty_entity_metrics = {
+            k: v for tmpl in self._entity_zero.values() for k, v in tmpl.items()
+        }
+        self._empty_entity_metrics.update(
+            {"total_entities": 0, "overall_schema_compliance": 1.0}
+        )
+        self._empty_relation_metrics = {
+            k: v
+            for tmpl in self._relation_zero.values()
+            for k, v in tmpl.items()
+        }
+        self._empty_relation_metrics.update(
+            {
+                "total_relations": 0,
+                "overall_schema_compliance": 1.0,
+                "overall_consistency": 1.0,
+            }
+        )
+
+    def evaluate_entities(self, predicted_entities):
+        """Per-type counts and schema-compliance ratios for entities."""
+        if not predicted_entities:
+            return dict(self._empty_entity_metrics)
+        metrics = {}
+        total_entities = 0
+        total_compliant = 0
+        for entity_type in self.entities_schema:
+            entities = predicted_entities.get(entity_type, [])
+            if not entities:
+                metrics.update(self._entity_zero[entity_type])
+                continue
+            req = self._req_sets[entity_type]
+            schema_compliant = sum(1 for e in entities if req <= e.keys())
+            count = len(entities)
+            total_entities += count
+            total_compliant += schema_compliant
+            metrics[f"{entity_type}_count"] = count
+            # The empty case returned above, so count is always > 0 here.
+            metrics[f"{entity_type}_schema_compliance"] = (
+                schema_compliant / count
+            )
+        metrics["total_entities"] = total_entities
+        metrics["overall_schema_compliance"] = (
+            total_compliant / total_entities if total_entities else 1.0
+        )
+        return metrics
+
+    def evaluate_relations(
+        self, predicted_relations, entities=None, entity_indices=None
+    ):
+        """Per-type counts, schema compliance and endpoint consistency.
+
+        ``entity_indices`` lets callers that already built the indices
+        (e.g. :meth:`evaluate`) pass them in instead of re-walking the
+        entity set here.
+        """
+        if not predicted_relations:
+            return dict(self._empty_relation_metrics)
+        _intern_relation_values(predicted_relations)
+        metrics = {}
+        if entity_indices is None:
+            entity_indices = self._build_entity_indices(entities or {})
+        total_relations = 0
+        total_schema_compliant = 0
+        total_consistent = 0
+        per_type = [
+            (rt, predicted_relations.get(rt, []))
+            for rt in self.relations_schema
+        ]
+        if self._use_parallel(sum(len(rels) for _, rels in per_type)):
+            with ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 1)
+            ) as pool:
+                counts = list(
+                    pool.map(
+                        lambda item: self._evaluate_relation_type(
+                            item[0], item[1], entity_indices
+                        ),
+                        per_type,
+                    )
+                )
+        else:
+            counts = [
+                self._evaluate_relation_type(rt, rels, entity_indices)
+                for rt, rels in per_type
+            ]
+        for (relation_type, relations), (
+            count,
+            schema_compliant,
+            consistent,
+        ) in zip(per_type, counts):
+            if not count:
+                metrics.update(self._relation_zero[relation_type])
+                continue
+            total_relations += count
+            total_schema_compliant += schema_compliant
+            total_consistent += consistent
+            metrics[f"{relation_type}_count"] = count
+            metrics[f"{relation_type}_schema_compliance"] = (
+                schema_compliant / count
+            )
+            metrics[f"{relation_type}_consistency"] = consistent / count
+        metrics["total_relations"] = total_relations
+        metrics["overall_schema_compliance"] = (
+            total_schema_compliant / total_relations if total_relations else 1.0
+        )
+        metrics["overall_consistency"] = (
+            total_consistent / total_relations if total_relations else 1.0
+        )
+        return metrics
+
+    @staticmethod
+    def _use_parallel(total_relations):
+        if total_relations < _PARALLEL_MIN_RELATIONS:
+            return False
+        return os.environ.get("KGEB_EVAL_PARALLEL") != "0"
+
+    def _evaluate_relation_type(self, relation_type, relations, entity_indices):
+        """Score one relation type: (count, schema_compliant, consistent).
+
+        The hot work here is C-level set intersections (and optionally
+        the Numba kernel), which release the GIL often enough that the
+        per-type fan-out in :meth:`evaluate_relations` pays off on large
+        prediction sets.
+        """
+        schema_compliant = 0
+        consistent = 0
+        use_jit = _count_consistent_jit is not None and relations
+        check_schema = self._rel_check[relation_type]
+        for relation in relations:
+            if check_schema(relation):
+                schema_compliant += 1
+            if not use_jit and self._check_relation_consistency(
+                relation, relation_type, entity_indices
+            ):
+                consistent += 1
+        if use_jit:
+            consistent = self._count_consistent_numba(
+                relations, relation_type, entity_indices
+            )
+        return len(relations), schema_compliant, consistent
+
+    def _check_relation_schema(self, relation, relation_type):
+        """True when the relation names both of its endpoints."""
+        return self._rel_check[relation_type](relation)
+
+    def _check_relation_consistency(self, relation, relation_type, entity_indices):
+        """True when both endpoints resolve to known extracted entities."""
+        relation_def = self.relations_schema[relation_type]
+        source_value, target_value = self._resolve_endpoints(
+            relation, relation_type
+        )
+        if source_value is None or target_value is None:
+            return False
+        return (
+            source_value
+            in entity_indices.get(relation_def.get("source_entity", ""), _EMPTY)
+            and target_value
+            in entity_indices.get(relation_def.get("target_entity", ""), _EMPTY)
+        )
+
+    def _resolve_endpoints(self, relation, relation_type):
+        """Pick the (source, target) values for *relation*, or None."""
+        keys = relation.keys()
+        key = next(
+            iter(keys & self._rel_src_typed[relation_type]), None
+        ) or next(iter(keys & self._rel_src_keys[relation_type]), None)
+        source_value = relation[key] if key else None
+        key = next(
+            iter(keys & self._rel_tgt_typed[relation_type]), None
+        ) or next(iter(keys & self._rel_tgt_keys[relation_type]), None)
+        target_value = relation[key] if key else None
+        return source_value, target_value
+
+    def _count_consistent_numba(self, relations, relation_type, entity_indices):
+        """Consistency count via the JIT kernel on int64-encoded endpoints.
+
+        Entity names and relation endpoints are encoded to int64 ids so
+        the membership loop runs without Python dispatch; endpoints that
+        resolve to no known entity encode to -1.
+        """
+        relation_def = self.relations_schema[relation_type]
+        ids = {}
+        valid_src = _empty_id_set()
+        for name in entity_indices.get(
+            relation_def.get("source_entity", ""), _EMPTY
+        ):
+            valid_src[ids.setdefault(name, len(ids))] = 1
+        valid_tgt = _empty_id_set()
+        for name in entity_indices.get(
+            relation_def.get("target_entity", ""), _EMPTY
+        ):
+            valid_tgt[ids.setdefault(name, len(ids))] = 1
+        src = np.empty(len(relations), np.int64)
+        tgt = np.empty(len(relations), np.int64)
+        for i, relation in enumerate(relations):
+            source_value, target_value = self._resolve_endpoints(
+                relation, relation_type
+            )
+            src[i] = ids.get(source_value, -1)
+            tgt[i] = ids.get(target_value, -1)
+        return _count_consistent_jit(src, tgt, valid_src, valid_tgt)
+
+    def _build_entity_indices(self, entities):
+        """Map each entity type to a {key attribute: entity} index."""
+        indices = {}
+        for entity_type, items in entities.items():
+            key_attr = self._key_attr.get(entity_type, "name")
+            # Interned keys share one string object with the interned
+            # relation endpoints, so index lookups hit the fast identity
+            # path and duplicate JSON-decoded strings are collapsed.
+            indices[entity_type] = {
+                _intern_if_str(entity[key_attr]): entity
+                for entity in items
+                if key_attr in entity
+            }
+        return indices
+
+    def evaluate(self, entities, relations):
+        """Run both evaluations and assemble the report payload."""
+        entity_indices = self._build_entity_indices(entities)
+        entity_metrics = self.evaluate_entities(entities)
+        relation_metrics = self.evaluate_relations(
+            relations, entity_indices=entity_indices
+        )
+        return {
+            "entity_metrics": entity_metrics,
+            "relation_metrics": relation_metrics,
+            "summary": {
+                "total_entities": entity_metrics["total_entities"],
+                "total_relations": relation_metrics["total_relations"],
+                "entity_schema_compliance": entity_metrics[
+                    "overall_schema_compliance"
+                ],
+                "relation_schema_compliance": relation_metrics[
+                    "overall_schema_compliance"
+                ],
+                "relation_consistency": relation_metrics[
+                    "overall_consistency"
+                ],
+            },
+        }
+
+
+class EntityEvaluator:
+    """Precision/recall/F1 of predicted entities against gold entities."""
+
+    def calculate_metrics(self, predicted_entities, gold_entities):
+        return _set_metrics(predicted_entities, gold_entities)
+
+
+class RelationEvaluator:
+    """Precision/recall/F1 of predicted relations against gold relations."""
+
+    def calculate_metrics(self, predicted_relations, gold_relations):
+        return _set_metrics(predicted_relations, gold_relations)
+
+
+def _set_metrics(predicted, gold):
+    """Per-type and overall precision/recall/F1 from canonical-set matching.
+
+    Large inputs are handed to Arrow, which computes the grouped
+    tp/fp/fn counts with vectorized kernels; small inputs (or trees
+    without pyarrow) use plain Python set algebra, which has no setup
+    cost.
+    """
+    canon = {
+        t: (_canonical_set(predicted.get(t, [])), _canonical_set(gold.get(t, [])))
+        for t in sorted(set(predicted) | set(gold))
+    }
+    total_items = sum(len(p) + len(g) for p, g in canon.values())
+    # The Arrow path stores canonical keys as binary columns, so it also
+    # needs the orjson (bytes) canonical form.
+    if pa is not None and orjson is not None and total_items >= _ARROW_MIN_ITEMS:
+        return _set_metrics_arrow(canon)
+    return _set_metrics_python(canon)
+
+
+def _set_metrics_python(canon):
+    metrics = {}
+    total_tp = total_fp = total_fn = 0
+    for item_type, (pred, gold) in canon.items():
+        tp = len(pred & gold)
+        fp = len(pred - gold)
+        fn = len(gold - pred)
+        total_tp += tp
+        total_fp += fp
+        total_fn += fn
+        metrics[item_type] = _prf(tp, fp, fn)
+    metrics["overall"] = _prf(total_tp, total_fp, total_fn)
+    return metrics
+
+
+def _set_metrics_arrow(canon):
+    pred_types, pred_keys = [], []
+    gold_types, gold_keys = [], []
+    for item_type, (pred, gold) in canon.items():
+        pred_types.extend([item_type] * len(pred))
+        pred_keys.extend(pred)
+        gold_types.extend([item_type] * len(gold))
+        gold_keys.extend(gold)
+    pred_tbl = pa.table(
+        {
+            "type": pred_types,
+            "key": pa.array(pred_keys, type=pa.binary()),
+            "in_pred": [1] * len(pred_keys),
+        }
+    )
+    gold_tbl = pa.table(
+        {
+            "type": gold_types,
+            "key": pa.array(gold_keys, type=pa.binary()),
+            "in_gold": [1] * len(gold_keys),
+        }
+    )
+    joined = pred_tbl.join(
+        gold_tbl, keys=["type", "key"], join_type="full outer"
+    )
+    in_pred = pc.is_valid(joined["in_pred"])
+    in_gold = pc.is_valid(joined["in_gold"])
+    flags = joined.select(["type"])
+    flags = flags.append_column("tp", pc.cast(pc.and_(in_pred, in_gold), pa.int64()))
+    flags = flags.append_column(
+        "fp", pc.cast(pc.and_(in_pred, pc.invert(in_gold)), pa.int64())
+    )
+    flags = flags.append_column(
+        "fn", pc.cast(pc.and_(pc.invert(in_pred), in_gold), pa.int64())
+    )
+    grouped = flags.group_by("type").aggregate(
+        [("tp", "sum"), ("fp", "sum"), ("fn", "sum")]
+    )
+    metrics = {}
+    total_tp = total_fp = total_fn = 0
+    for row in grouped.to_pylist():
+        tp, fp, fn = row["tp_sum"], row["fp_sum"], row["fn_sum"]
+        total_tp += tp
+        total_fp += fp
+        total_fn += fn
+        metrics[row["type"]] = _prf(tp, fp, fn)
+    # Types absent from the join (both sides empty) still get a row.
+    for item_type in canon:
+        metrics.setdefault(item_type, _prf(0, 0, 0))
+    metrics["overall"] = _prf(total_tp, total_fp, total_fn)
+    return metrics
+
+
+def _canonical_set(items):
+    """Canonical hashable keys for a list of entity/relation dicts.
+
+    orjson serializes each dict with sorted keys in one C call, giving a
+    compact bytes key that hashes faster than a tuple of sorted items;
+    the tuple form is kept as the pure-Python fallback.
+    """
+    if orjson is not None:
+        return {
+            orjson.dumps(item, option=orjson.OPT_SORT_KEYS) for item in items
+        }
+    return {tuple(sorted(item.items())) for item in items}
+
+
+def _prf(tp, fp, fn):
+    """Build an :class:`ExtractionMetrics` record from raw counts."""
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = (
+        2 * precision * recall / (precision + recall)
+        if precision + recall
+        else 0.0
+    )
+    return ExtractionMetrics(precision, recall, f1, tp, fp, fn)
+
+
+class EvaluationReport:
+    """Serializes the evaluation payload to a JSON report."""
+
+    def generate_report(
+        self, report, output_file="evaluation_report.json", compact=False
+    ):
+        """Write *report* to *output_file*; ``compact`` omits indentation."""
+        report = dict(report)
+        report["generated_at"] = (
+            datetime.now(timezone.utc)
+            .isoformat(timespec="seconds")
+            .replace("+00:00", "Z")
+        )
+        if orjson is not None:
+            # orjson serializes the ExtractionMetrics dataclasses natively.
+            option = 0 if compact else orjson.OPT_INDENT_2
+            with open(output_file, "wb") as f:
+                f.write(orjson.dumps(report, option=option))
+        else:
+            with open(output_file, "w", encoding="utf-8") as f:
+                if compact:
+                    json.dump(report, f, separators=(",", ":"), default=asdict)
+                else:
+                    json.dump(
+                        report, f, indent=2, ensure_ascii=False, default=asdict
+                    )
+        return report
+
+
+def _load_json(path):
+    """Read a JSON file, using orjson's C parser when available."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_evaluator(entities_schema_path, relations_schema_path):
+    """Build an :class:`Evaluator` for the given schema files, cached.
+
+    Repeated benchmark runs reuse the parsed schemas and all of the
+    evaluator's precomputed lookup structures; the cache key includes
+    each file's mtime so edits invalidate it.
+    """
+    return _load_evaluator_cached(
+        entities_schema_path,
+        os.stat(entities_schema_path).st_mtime_ns,
+        relations_schema_path,
+        os.stat(relations_schema_path).st_mtime_ns,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_evaluator_cached(
+    entities_schema_path, _entities_mtime_ns, relations_schema_path, _relations_mtime_ns
+):
+    entities_schema = _load_json(entities_schema_path)
+    relations_schema = {
+        rel["id"]: rel
+        for rel in _load_json(relations_schema_path).get("relations", [])
+    }
+    return Evaluator(entities_schema, relations_schema)
+
+
+def evaluate_extraction(
+    entities_schema_path="entities.json",
+    relations_schema_path="relations.json",
+    entities_path="entities_output.json",
+    relations_path="relations_output.json",
+    gold_entities_path="gold_entities.json",
+    gold_relations_path="gold_relations.json",
+    output_path="evaluation_report.json",
+):
+    """Evaluate an extraction run and write ``evaluation_report.json``."""
+    evaluator = load_evaluator(entities_schema_path, relations_schema_path)
+    entities = _load_json(entities_path)
+    relations = (
+        _load_json(relations_path) if os.path.exists(relations_path) else {}
+    )
+    report = evaluator.evaluate(entities, relations)
+
+    if os.path.exists(gold_entities_path):
+        gold_metrics = EntityEvaluator().calculate_metrics(
+            entities, _load_json(gold_entities_path)
+        )
+        report["entity_gold_metrics"] = gold_metrics
+        report["summary"]["entity_f1"] = gold_metrics["overall"].f1_score
+    if os.path.exists(gold_relations_path):
+        gold_metrics = RelationEvaluator().calculate_metrics(
+            relations, _load_json(gold_relations_path)
+        )
+        report["relation_gold_metrics"] = gold_metrics
+        report["summary"]["relation_f1"] = gold_metrics["overall"].f1_score
+
+    return EvaluationReport().generate_report(report, output_path)
+
+
+if __name__ == "__main__":
+    evaluate_extraction()
@@ -0,0 +1,36 @@
+"""Print the modification timeline of the benchmark artifacts."""
+
+import os
+from datetime import datetime
+
+FILES_TO_CHECK = [
+    "documents.txt",
+    "entities_output.json",
+    "relations_output.json",
+    "evaluation_report.json",
+    "summary_report.json",
+]
+
+
+def get_timeline(files=FILES_TO_CHECK):
+    """Return (filename, mtime) pairs for existing files, oldest first."""
+    # One scandir pass gives every entry's cached stat, instead of an
+    # exists() plus getmtime() stat pair per file.
+    with os.scandir(".") as it:
+        mtimes = {e.name: e.stat().st_mtime for e in it if e.is_file()}
+    times = [
+        (file, datetime.fromtimestamp(mtimes[file]))
+        for file in files
+        if file in mtimes
+    ]
+    times.sort(key=lambda item: item[1])
+    return times
+
+
+def main():
+    for name, ts in get_timeline():
+        print(f"{ts:%Y-%m-%d %H:%M:%S}  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""KGEB: knowledge-graph extraction benchmark pipeline."""
@@ -0,0 +1,56 @@
+"""Configuration and input loading for the kgeb pipeline."""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is the fallback
+    orjson = None
+
+DOCUMENTS_PATH = "documents.txt"
+ENTITIES_SCHEMA_PATH = "entities.json"
+RELATIONS_SCHEMA_PATH = "relations.json"
+OUTPUT_DIR = "output"
+
+
+@lru_cache(maxsize=None)
+def load_documents(path=DOCUMENTS_PATH):
+    """Return the benchmark documents as a tuple of lines.
+
+    Iterating the file object keeps one line alive at a time instead of
+    materializing the whole file as a string first; the enlarged buffer
+    cuts read syscalls on multi-MB corpora. Results are cached per path
+    for the life of the process and returned immutable so cache entries
+    cannot be corrupted by callers.
+    """
+    with open(path, "r", encoding="utf-8", buffering=1 << 17) as f:
+        return tuple(line.rstrip("\n") for line in f)
+
+
+def _read_json(path):
+    """Parse a JSON file in one read, via orjson when available."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def load_entities_schema(path=ENTITIES_SCHEMA_PATH):
+    """Load the entity schema mapping type names to attribute lists.
+
+    Cached per path; the returned mapping is read-only.
+    """
+    return MappingProxyType(_read_json(path))
+
+
+@lru_cache(maxsize=None)
+def load_relations_schema(path=RELATIONS_SCHEMA_PATH):
+    """Load the relation schema document.
+
+    Cached per path; the returned mapping is read-only.
+    """
+    return MappingProxyType(_read_json(path))
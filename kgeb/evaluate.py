@@ -0,0 +1,161 @@
+"""Schema-compliance helpers for the kgeb pipeline."""
+
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is the fallback
+    orjson = None
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # pragma: no cover - Python compliance loop fallback
+    np = None
+    njit = None
+
+if njit is not None:  # pragma: no cover - requires numba
+
+    @njit(cache=True)
+    def _compliance_count_jit(item_masks, required_mask):
+        compliant = 0
+        for i in range(item_masks.shape[0]):
+            if item_masks[i] & required_mask == required_mask:
+                compliant += 1
+        return compliant
+
+else:
+    _compliance_count_jit = None
+
+# Below this many items the mask-building pass costs more than the
+# Python issubset loop it replaces.
+_JIT_MIN_ITEMS = 100_000
+
+
+def _bitmask_compliant(items, fields):
+    """Compliance count via the JIT bitmask kernel, or None when unsuitable.
+
+    Each required field maps to one bit of a uint64; an item's mask ORs
+    the bits of the required fields it carries, and the kernel counts
+    items whose mask covers the full required mask. Falls back (returns
+    None) without numba, for empty or >64-field schemas, and for small
+    inputs.
+    """
+    if (
+        _compliance_count_jit is None
+        or not fields
+        or len(fields) > 64
+        or len(items) < _JIT_MIN_ITEMS
+    ):
+        return None
+    bit = {field: 1 << i for i, field in enumerate(fields)}
+    masks = np.zeros(len(items), np.uint64)
+    for i, it in enumerate(items):
+        mask = 0
+        for field, b in bit.items():
+            if field in it:
+                mask |= b
+        masks[i] = mask
+    required_mask = np.uint64((1 << len(fields)) - 1)
+    return int(_compliance_count_jit(masks, required_mask))
+
+
+def _canon(obj):
+    """Canonical sorted-key serialization of one item, bytes when possible."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True)
+
+
+def load_json(path):
+    """Load a JSON document from *path* in one read."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _canon_tuple(it):
+    """Hashable canonical form of one shallow item, skipping the encoder.
+
+    Falls back to JSON canonicalization when a value is unhashable
+    (nested lists or dicts).
+    """
+    key = tuple(sorted(it.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return _canon(it)
+    return key
+
+
+def flatten_entities(entities):
+    """Flatten an entity dict into a set of (type, canonical-item) pairs."""
+    return {
+        (etype, _canon_tuple(it))
+        for etype, items in entities.items()
+        for it in items
+    }
+
+
+def schema_compliance(entities, schema):
+    """Per-type counts of items carrying every required attribute."""
+    report = {}
+    required_by_etype = {
+        etype: frozenset(fields) for etype, fields in schema.items()
+    }
+    for etype, items in entities.items():
+        fields = schema.get(etype, [])
+        compliant = _bitmask_compliant(items, fields)
+        if compliant is None:
+            required = required_by_etype.get(etype, frozenset())
+            compliant = 0
+            for it in items:
+                # dict_keys supports <= against a set directly; no
+                # per-item set allocation.
+                if required <= it.keys():
+                    compliant += 1
+        report[etype] = {"count": len(items), "compliant": compliant}
+    return report
+
+
+def generate_evaluation_report(
+    pred_entities, gold_entities, schema, out_path="evaluation_report.json"
+):
+    """Score predictions against gold and write the report JSON."""
+    pred = flatten_entities(pred_entities)
+    gold = flatten_entities(gold_entities)
+    tp = len(pred & gold)
+    fp = len(pred) - tp
+    fn = len(gold) - tp
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = (
+        2 * precision * recall / (precision + recall)
+        if precision + recall
+        else 0.0
+    )
+    report = {
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
+        "schema_compliance": schema_compliance(pred_entities, schema),
+        "generated_at": datetime.now(timezone.utc)
+        .isoformat(timespec="seconds")
+        .replace("+00:00", "Z"),
+    }
+    if orjson is not None:
+        # Pretty-print once in native code; the same bytes serve the
+        # file and stdout.
+        payload = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+        Path(out_path).write_bytes(payload)
+        sys.stdout.buffer.write(payload)
+        sys.stdout.buffer.write(b"\n")
+    else:
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(json.dumps(report, indent=2))
+    return report
@@ -0,0 +1,248 @@
+"""Prediction scoring for the kgeb pipeline.
+
+Computes duplicate-aware precision/recall/F1 over canonicalized items,
+relation-reference consistency against the extracted entities, and
+within-type attribute conflicts.
+"""
+
+import json
+from collections import Counter
+from datetime import datetime, timezone
+from .evaluate import _bitmask_compliant
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is the fallback
+    orjson = None
+
+
+def _canon(obj):
+    """Canonical sorted-key serialization of one item, bytes when possible."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True)
+
+
+def canonicalize_entities(entities):
+    """Canonicalize every item once for reuse across evaluations.
+
+    Callers that score several prediction sets against the same gold
+    entities can canonicalize the gold side a single time and pass the
+    result straight to :func:`evaluate_all` or
+    :func:`evaluate_relations`.
+    """
+    return {
+        etype: [_canon(it) for it in items]
+        for etype, items in entities.items()
+    }
+
+
+def _canon_item(it):
+    """Canonicalize *it* unless it already is a canonical key."""
+    return it if isinstance(it, (bytes, str)) else _canon(it)
+
+
+def precision_recall_f1(pred, gold):
+    """Duplicate-aware P/R/F1 between two collections of items.
+
+    Accepts lists of dicts or precomputed ``Counter``s of canonical
+    keys, letting callers that already counted skip re-serialization.
+    """
+    pred_counter = (
+        pred
+        if isinstance(pred, Counter)
+        else Counter(_canon_item(p) for p in pred)
+    )
+    gold_counter = (
+        gold
+        if isinstance(gold, Counter)
+        else Counter(_canon_item(g) for g in gold)
+    )
+    tp = sum((pred_counter & gold_counter).values())
+    fp = sum((pred_counter - gold_counter).values())
+    fn = sum((gold_counter - pred_counter).values())
+    return _prf_dict(tp, fp, fn)
+
+
+def _prf_dict(tp, fp, fn):
+    """Assemble the metrics dict from raw tp/fp/fn counts."""
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = (
+        2 * precision * recall / (precision + recall)
+        if precision + recall
+        else 0.0
+    )
+    return {
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
+        "tp": tp,
+        "fp": fp,
+        "fn": fn,
+    }
+
+
+def evaluate_all(pred_entities, gold_entities):
+    """P/R/F1 over every entity type at once."""
+    tp = fp = fn = 0
+    for etype in pred_entities.keys() | gold_entities.keys():
+        pred_items = pred_entities.get(etype) or []
+        gold_items = gold_entities.get(etype) or []
+        # Nothing on one side means nothing can match; count the other
+        # side without canonicalizing it.
+        if not pred_items or not gold_items:
+            fp += len(pred_items)
+            fn += len(gold_items)
+            continue
+        pred_counter = Counter(_canon_item(p) for p in pred_items)
+        gold_counter = Counter(_canon_item(g) for g in gold_items)
+        matched = sum((pred_counter & gold_counter).values())
+        tp += matched
+        fp += len(pred_items) - matched
+        fn += len(gold_items) - matched
+    return _prf_dict(tp, fp, fn)
+
+
+def evaluate_relations(pred_relations, gold_relations=None, entities=None):
+    """Score relations against gold and check endpoint references.
+
+    When *gold_relations* is given, per-type P/R/F1 is computed on
+    canonicalized relation dicts. When *entities* is given, every string
+    value in every relation is checked against the extracted entity
+    names and unresolvable references are reported.
+    """
+    report = {}
+    if gold_relations is not None:
+        per_type = {}
+        for rtype in pred_relations.keys() | gold_relations.keys():
+            pred_rels = pred_relations.get(rtype) or []
+            gold_rels = gold_relations.get(rtype) or []
+            if not pred_rels or not gold_rels:
+                per_type[rtype] = {
+                    "tp": 0,
+                    "fp": len(pred_rels),
+                    "fn": len(gold_rels),
+                }
+                continue
+            pred_set = {_canon_item(r) for r in pred_rels}
+            gold_set = {_canon_item(r) for r in gold_rels}
+            # One intersection; the differences follow by arithmetic.
+            tp = len(pred_set & gold_set)
+            fp = len(pred_set) - tp
+            fn = len(gold_set) - tp
+            per_type[rtype] = {"tp": tp, "fp": fp, "fn": fn}
+        report["per_type"] = per_type
+    if entities is not None:
+        total = 0
+        missing = 0
+        missing_refs = {}
+        all_names = {
+            it["name"]
+            for items in entities.values()
+            for it in items
+            if it.get("name")
+        }
+        for rtype, rels in pred_relations.items():
+            for rel in rels:
+                for k, v in rel.items():
+                    if not isinstance(v, str):
+                        continue
+                    total += 1
+                    if v not in all_names:
+                        missing += 1
+                        missing_refs.setdefault(rtype, []).append({k: v})
+        report["total_refs"] = total
+        report["missing_refs"] = missing
+        report["details"] = missing_refs
+    return report
+
+
+def schema_compliance(entities, schema):
+    """Per-type compliance counts (evaluator-side variant)."""
+    report = {}
+    required_by_etype = {
+        etype: frozenset(fields) for etype, fields in schema.items()
+    }
+    for etype, items in entities.items():
+        fields = schema.get(etype, [])
+        compliant = _bitmask_compliant(items, fields)
+        if compliant is None:
+            required = required_by_etype.get(etype, frozenset())
+            compliant = 0
+            for it in items:
+                if required <= it.keys():
+                    compliant += 1
+        report[etype] = {"count": len(items), "compliant": compliant}
+    return report
+
+
+def detect_entity_conflicts(entities):
+    """Find same-name items whose other attributes disagree."""
+    conflicts = {}
+    for etype, items in entities.items():
+        by_name = {}
+        for it in items:
+            name = it.get("name")
+            if not name:
+                continue
+            # Only observed (field, value) pairs are kept — no per-name
+            # copy of the full record.
+            seen = by_name.setdefault(name, {})
+            for k, v in it.items():
+                if k == "name" or not v:
+                    continue
+                existing = seen.get(k)
+                if existing is None:
+                    seen[k] = v
+                elif existing != v:
+                    conflicts.setdefault(etype, {}).setdefault(
+                        name, []
+                    ).append({"field": k, "existing": existing, "new": v})
+    return conflicts
+
+
+def build_report(
+    pred_entities,
+    pred_relations,
+    gold_entities=None,
+    gold_relations=None,
+    entities_schema=None,
+):
+    """Assemble the full evaluation report dict."""
+    report = {
+        "generated_at": datetime.now(timezone.utc)
+        .isoformat(timespec="seconds")
+        .replace("+00:00", "Z")
+    }
+    if gold_entities is not None:
+        report["entities"] = evaluate_all(pred_entities, gold_entities)
+    report["relations"] = evaluate_relations(
+        pred_relations, gold_relations, entities=pred_entities
+    )
+    if entities_schema is not None:
+        report["schema_compliance"] = schema_compliance(
+            pred_entities, entities_schema
+        )
+    report["conflicts"] = detect_entity_conflicts(pred_entities)
+    return report
+
+
+if __name__ == "__main__":
+    import sys
+
+    from .evaluate import load_json
+
+    pred_e_path = Path("entities_output.json")
+    pred_r_path = Path("relations_output.json")
+    pred_entities = load_json(pred_e_path) if pred_e_path.exists() else {}
+    pred_relations = load_json(pred_r_path) if pred_r_path.exists() else {}
+    report = build_report(pred_entities, pred_relations)
+    if orjson is not None:
+        sys.stdout.buffer.write(
+            orjson.dumps(report, option=orjson.OPT_INDENT_2)
+        )
+        sys.stdout.buffer.write(b"\n")
+    else:
+        print(json.dumps(report, indent=2))
@@ -0,0 +1,119 @@
+"""Lightweight line-oriented extractors for the kgeb pipeline.
+
+A slimmer counterpart to the root ``entity_extraction`` module: the CLI
+feeds it one document at a time, so the extractors here work on small
+strings (or iterables of lines) and return plain dicts keyed by entity
+or relation type.
+"""
+
+import re
+
+person_re = re.compile(
+    r"(?P<name>[A-Z][a-z]+(?: [A-Z][a-z]+)*), age (?P<age>\d+), "
+    r"works at (?P<company>[A-Za-z0-9]+) as an? (?P<position>[A-Za-z][A-Za-z ]*)\."
+)
+
+manage_re = re.compile(
+    r"(?P<person>[A-Z][a-z]+(?: [A-Z][a-z]+)*) "
+    r"(?P<verb>manages|leads|oversees|supervises|handles|coordinates|directs) "
+    r"\d+ projects?: (?P<projects>.+)\."
+)
+
+project_re = re.compile(r"^[Pp]roject\s+(?P<name>[A-Za-z0-9\-]+)")
+
+date_re = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# One alternation covering every company verb phrase, so each line is
+# scanned once instead of once per substring test.
+company_verb_re = re.compile(
+    r"(?P<company>[A-Za-z0-9]+) "
+    r"(?:operates in(?: the)?|specializes in|focuses on|is known for|works in) "
+    r"(?P<industry>.+?)(?: industry| sectors?)?\.$"
+)
+
+
+def extract_entities(text):
+    """Extract Person/Company/Project entities from *text*.
+
+    ``text`` may be a string or an iterable of lines.
+    """
+    results = {"Person": [], "Company": [], "Project": []}
+    lines = text.splitlines() if isinstance(text, str) else text
+    # Bind the per-line lookups as locals; attribute resolution per
+    # iteration is measurable at corpus scale.
+    person_match = person_re.match
+    project_match = project_re.match
+    find_dates = date_re.findall
+    company_match = company_verb_re.match
+    append_person = results["Person"].append
+    append_company = results["Company"].append
+    append_project = results["Project"].append
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        m = person_match(stripped)
+        if m:
+            append_person(
+                {
+                    "name": m.group("name"),
+                    "age": int(m.group("age")),
+                    "company": m.group("company"),
+                    "position": m.group("position").strip(),
+                }
+            )
+            continue
+        if stripped[:8].lower() == "project ":
+            m = project_match(stripped)
+            if m:
+                dates = find_dates(stripped)
+                append_project(
+                    {
+                        "name": m.group("name"),
+                        "start_date": dates[0] if dates else None,
+                        "end_date": dates[1] if len(dates) > 1 else None,
+                    }
+                )
+            continue
+        m = company_match(stripped)
+        if m:
+            append_company(
+                {"name": m.group("company"), "industry": m.group("industry")}
+            )
+    for etype, items in results.items():
+        seen = set()
+        unique = []
+        for it in items:
+            key = it.get("name") or it.get("title")
+            if key and key not in seen:
+                seen.add(key)
+                unique.append(it)
+        results[etype] = unique
+    return results
+
+
+def extract_relations(text, entities):
+    """Derive WorksAt/ManagesProject relations from *text* and *entities*."""
+    relations = {"WorksAt": [], "ManagesProject": []}
+    for person in entities.get("Person", []):
+        if person.get("company"):
+            relations["WorksAt"].append(
+                {"person": person["name"], "company": person["company"]}
+            )
+    lines = text.splitlines() if isinstance(text, str) else text
+    manage_match = manage_re.match
+    append_manages = relations["ManagesProject"].append
+    for line in lines:
+        m = manage_match(line.strip())
+        if m:
+            person = m.group("person")
+            for project in m.group("projects").split(", "):
+                append_manages({"person": person, "project": project})
+    return relations
+
+
+if __name__ == "__main__":
+    with open("documents.txt", "r", encoding="utf-8", buffering=1 << 17) as f:
+        extracted = extract_entities(f)
+    for etype, items in extracted.items():
+        print(f"{etype}: {len(items)}")
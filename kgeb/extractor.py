@@ -0,0 +1,70 @@
+"""Whole-document person extractor for the kgeb pipeline.
+
+Unlike the line-oriented ``kgeb.extract`` module, this extractor works
+on a full document string: person records seed the entity set, and a
+second pass collects attributes mentioned anywhere else in the document
+(``age is 32``, ``position: Researcher``, ``department: Engineering``).
+"""
+
+try:  # linear-time RE2 engine when available
+    import re2 as re
+except ImportError:  # pragma: no cover - backtracking stdlib re fallback
+    import re
+from functools import lru_cache
+
+PERSON_LINE_RE = re.compile(
+    r"(?P<name>[A-Z][a-z]+(?: [A-Z][a-z]+)*), age (?P<age>\d+), "
+    r"works at (?P<company>[A-Za-z0-9]+) as an? "
+    r"(?P<position>[A-Za-z][A-Za-z \-]*)\."
+)
+
+
+@lru_cache(maxsize=32)
+def _attr_pattern(names):
+    """One alternation over *names* followed by any attribute mention.
+
+    Compiled once per distinct name set; longer names sort first so the
+    alternation never stops at a prefix of a longer match. A single
+    ``finditer`` with this pattern replaces one ``re.search`` per name
+    per attribute over the whole document. Case-sensitive: the names
+    are exact captures and the attribute keywords are fixed lowercase
+    wording, so IGNORECASE would only inflate the state machine.
+    """
+    alternation = "|".join(
+        re.escape(n) for n in sorted(names, key=len, reverse=True)
+    )
+    return re.compile(
+        rf"(?P<name>{alternation})\s*.*?"
+        r"(?:age\s*(?:is|:)?\s*(?P<age>\d+)"
+        r"|(?:position|title)\s*(?:is|:)\s*(?P<position>[^\n.]+)"
+        r"|department\s*(?:is|:)\s*(?P<department>[^\n.]+))",
+        re.S,
+    )
+
+
+def _merge_attributes(doc, people):
+    """Fill attributes mentioned outside the person records, in one scan."""
+    for m in _attr_pattern(tuple(people)).finditer(doc):
+        person = people[m.group("name")]
+        age, position, department = m.group("age", "position", "department")
+        if age is not None and "age" not in person:
+            person["age"] = int(age)
+        elif position is not None and "position" not in person:
+            person["position"] = position.strip()
+        elif department is not None and "department" not in person:
+            person["department"] = department.strip()
+
+
+def extract_entities(doc):
+    """Extract Person entities, with attributes, from document *doc*."""
+    people = {}
+    for m in PERSON_LINE_RE.finditer(doc):
+        people[m.group("name")] = {
+            "name": m.group("name"),
+            "age": int(m.group("age")),
+            "company": m.group("company"),
+            "position": m.group("position").strip(),
+        }
+    if people:
+        _merge_attributes(doc, people)
+    return {"Person": list(people.values())}
@@ -0,0 +1,251 @@
+"""Line-dispatch entity and relation extractors for the kgeb pipeline.
+
+Works on pre-split document lines: each line is classified by the first
+matching pattern (person record, project record, management line,
+company/industry line) and contributes entities and, in a second pass,
+relations.
+"""
+
+import sys
+
+try:  # linear-time RE2 engine when available
+    import re2 as re
+except ImportError:  # pragma: no cover - backtracking stdlib re fallback
+    import re
+
+from .relations import MANAGEMENT_RE
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - substring scan is the fallback
+    ahocorasick = None
+
+try:
+    from . import _extractors  # compiled from _extractors.pyx (optional)
+except ImportError:  # pragma: no cover - pure-Python loop is the fallback
+    _extractors = None
+
+WORKS_AT_RE = re.compile(
+    r"^(?P<name>[A-Za-z\-\s]+?), age (?P<age>\d+), "
+    r"works at (?P<company>[A-Za-z0-9]+) as an? "
+    r"(?P<position>[A-Za-z][A-Za-z \-]*)\."
+)
+
+PROJECT_LINE_RE = re.compile(
+    r"^Project (?P<name>[A-Za-z0-9\-]+) \w+ on (?P<start>\d{4}-\d{2}-\d{2}), "
+    r"\w+ on (?P<end>\d{4}-\d{2}-\d{2})\."
+)
+
+CITIES = ("Shenzhen", "Hangzhou")
+
+if ahocorasick is not None:  # pragma: no cover - requires pyahocorasick
+    _CITY_AUTOMATON = ahocorasick.Automaton()
+    for _city in CITIES:
+        _CITY_AUTOMATON.add_word(_city, _city)
+    _CITY_AUTOMATON.make_automaton()
+else:
+    _CITY_AUTOMATON = None
+
+# No IGNORECASE: the verb phrases are fixed lowercase wording and the
+# character classes already spell out both cases, so case-insensitive
+# matching would only double the state-machine work.
+COMPANY_INDUSTRY_RE = re.compile(
+    r"^(?P<company>[A-Za-z0-9]+) "
+    r"(?:operates in|specializes in|focuses on|is known for|works in)"
+    r"(?: the)? (?P<industry>[A-Za-z0-9 &\-]+?)(?: industry| sectors?)?\."
+)
+
+
+def extract_all(doc_iter):
+    """Extract entities and relations from the lines of *doc_iter*.
+
+    *doc_iter* may be any iterable of lines — a list, the streaming
+    generator from :func:`kgeb.loader.iter_documents` split per record,
+    or a file object — and is consumed exactly once: a cheap substring
+    classifier routes each line to at most one pattern, whose handler
+    emits into both result structures at once. Entities
+    of each type accumulate in a name-keyed dict, so membership checks
+    for managers and managed projects are O(1) probes, the dict doubles
+    as the dedup map, and ``values()`` preserves first-seen order.
+    """
+    if _extractors is not None:
+        return _extractors.extract_all(
+            doc_iter,
+            WORKS_AT_RE,
+            PROJECT_LINE_RE,
+            MANAGEMENT_RE,
+            COMPANY_INDUSTRY_RE,
+            CITIES,
+        )
+    persons = {}
+    companies = {}
+    projects = {}
+    relations = {"WorksAt": [], "ManagesProject": [], "LocatedIn": []}
+    # The same person/company/project strings recur across records and
+    # relations; interning collapses them to one object each and gives
+    # the dedup sets their pointer-equality fast path.
+    intern = sys.intern
+
+    def handle_works_at(m):
+        name = intern(m.group("name"))
+        company = intern(m.group("company"))
+        if name not in persons:
+            persons[name] = {
+                "name": name,
+                "age": int(m.group("age")),
+                "company": company,
+                "position": m.group("position").strip(),
+            }
+        if company not in companies:
+            companies[company] = {"name": company}
+        relations["WorksAt"].append({"person": name, "company": company})
+
+    def handle_project(m):
+        name = intern(m.group("name"))
+        if name not in projects:
+            projects[name] = {
+                "name": name,
+                "start_date": m.group("start"),
+                "end_date": m.group("end"),
+            }
+
+    def handle_manages(m):
+        manager = intern(m.group("manager"))
+        if manager not in persons:
+            persons[manager] = {"name": manager}
+        for project in m.group("projects").split(","):
+            project = project.strip()
+            if not project:
+                continue
+            project = intern(project)
+            if project not in projects:
+                projects[project] = {"name": project}
+            relations["ManagesProject"].append(
+                {"person": manager, "project": project}
+            )
+
+    def handle_industry(m):
+        company = intern(m.group("company"))
+        entry = companies.setdefault(company, {"name": company})
+        entry.setdefault("industry", m.group("industry").strip())
+
+    def handle_city(ln):
+        if _CITY_AUTOMATON is not None:  # pragma: no cover
+            # One automaton pass finds every city mention regardless
+            # of how many cities are known.
+            for _end, city in _CITY_AUTOMATON.iter(ln):
+                parts = ln.split()
+                if parts:
+                    relations["LocatedIn"].append(
+                        {"company": parts[0], "location": city}
+                    )
+        else:
+            # One substring probe per line and one bounded split for
+            # the leading token, instead of a split per city hit.
+            city = next((c for c in CITIES if c in ln), None)
+            if city is not None:
+                first = ln.split(None, 1)
+                if first:
+                    relations["LocatedIn"].append(
+                        {"company": first[0], "location": city}
+                    )
+
+    works_match = WORKS_AT_RE.match
+    project_match = PROJECT_LINE_RE.match
+    management_match = MANAGEMENT_RE.match
+    industry_match = COMPANY_INDUSTRY_RE.match
+    for ln in doc_iter:
+        ln = ln.strip()
+        if not ln:
+            continue
+        # Cheap substring probes route each line to at most one pattern
+        # before any regex state machine is set up.
+        if ", age " in ln:
+            m = works_match(ln)
+            if m:
+                handle_works_at(m)
+                continue
+        elif ln.startswith("Project "):
+            m = project_match(ln)
+            if m:
+                handle_project(m)
+                continue
+        elif " manages " in ln or " leads " in ln or " oversees " in ln:
+            m = management_match(ln)
+            if m:
+                handle_manages(m)
+                continue
+        else:
+            m = industry_match(ln)
+            if m:
+                handle_industry(m)
+                continue
+        handle_city(ln)
+    for rtype, rels in relations.items():
+        seen = set()
+        unique = []
+        for rel in rels:
+            # Relation values are str/int/None, so a sorted item tuple
+            # is a hashable exact-match key without JSON encoding.
+            key = tuple(sorted(rel.items()))
+            if key not in seen:
+                seen.add(key)
+                unique.append(rel)
+        relations[rtype] = unique
+    entities = {
+        "Person": list(persons.values()),
+        "Company": list(companies.values()),
+        "Project": list(projects.values()),
+    }
+    return entities, relations
+
+
+# Most recent (entities, relations) pair produced through the wrapper
+# API, so extract_relations can reuse it instead of re-walking the
+# lines when handed the entities object extract_entities returned.
+_last_result = None
+
+
+def extract_entities(doc_iter):
+    """Extract Person/Company/Project entities from *doc_iter*."""
+    global _last_result
+    _last_result = extract_all(doc_iter)
+    return _last_result[0]
+
+
+def extract_relations(doc_iter, entities=None):
+    """Extract WorksAt/ManagesProject/LocatedIn relations.
+
+    When *entities* is the object returned by the preceding
+    :func:`extract_entities` call, the relations captured in that same
+    pass are returned directly — no second iteration over the lines and
+    no repeated pattern matching. New callers should prefer
+    :func:`extract_all`, which hands back both structures at once.
+    """
+    if (
+        entities is not None
+        and _last_result is not None
+        and entities is _last_result[0]
+    ):
+        return _last_result[1]
+    return extract_all(doc_iter)[1]
+
+
+if __name__ == "__main__":
+    from .gold_generator import _dump
+    from .loader import iter_documents
+
+    all_entities = {}
+    all_relations = {}
+    for doc in iter_documents():
+        entities, relations = extract_all(doc.splitlines())
+        for etype, items in entities.items():
+            all_entities.setdefault(etype, []).extend(items)
+        for rtype, rels in relations.items():
+            all_relations.setdefault(rtype, []).extend(rels)
+    _dump(all_entities, "extracted_entities.json")
+    _dump(all_relations, "extracted_relations.json")
+    print(
+        f"entities: {sum(map(len, all_entities.values()))}, "
+        f"relations: {sum(map(len, all_relations.values()))}"
+    )
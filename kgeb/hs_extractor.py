@@ -0,0 +1,76 @@
+"""Hyperscan-accelerated document scanning for the kgeb pipeline.
+
+Hyperscan compiles all line patterns into one DFA and scans a document
+in a single SIMD-accelerated pass, reporting every match with its
+offsets. The matches locate the few lines worth parsing, which are then
+handed to the ordinary dispatcher — so the per-line Python regex
+attempts are only paid for lines known to match something. Without the
+``hyperscan`` package the scan falls back to the plain dispatcher.
+"""
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - pure-Python dispatcher fallback
+    hyperscan = None
+
+from .extractors import extract_all
+
+# Capture-free mirrors of the dispatcher's patterns (Hyperscan does not
+# support named groups); ids index this tuple. The city literals keep
+# LocatedIn lines in the filtered set.
+_EXPRESSIONS = (
+    rb"^[A-Za-z\-\s]+?, age \d+, works at [A-Za-z0-9]+ as an? "
+    rb"[A-Za-z][A-Za-z \-]*\.",
+    rb"^Project [A-Za-z0-9\-]+ [a-z]+ on \d{4}-\d{2}-\d{2}, "
+    rb"[a-z]+ on \d{4}-\d{2}-\d{2}\.",
+    rb"^[A-Za-z\-\s]+? (?:manages|leads|oversees) \d+ projects?:"
+    rb"[A-Za-z0-9\-,\s]+\.",
+    rb"^[A-Za-z0-9]+ "
+    rb"(?:operates in|specializes in|focuses on|is known for|works in)"
+    rb"(?: the)? [A-Za-z0-9 &\-]+\.",
+    rb"Shenzhen",
+    rb"Hangzhou",
+)
+
+_db = None
+
+
+def _database():
+    """Compile the expression set once per process."""
+    global _db
+    if _db is None:
+        _db = hyperscan.Database()
+        _db.compile(
+            expressions=list(_EXPRESSIONS),
+            ids=list(range(len(_EXPRESSIONS))),
+            flags=[
+                hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_SOM_LEFTMOST
+            ]
+            * len(_EXPRESSIONS),
+        )
+    return _db
+
+
+def extract_all_hs(doc):
+    """Extract entities and relations from document string *doc*.
+
+    One Hyperscan pass selects the matching lines; the dispatcher then
+    parses only those. Equivalent to ``extract_all(doc.splitlines())``
+    because unmatched lines never contribute output.
+    """
+    if hyperscan is None:
+        return extract_all(doc.splitlines())
+    data = doc.encode("utf-8")
+    line_starts = set()
+
+    def on_match(expr_id, start, end, flags, context=None):
+        line_starts.add(data.rfind(b"\n", 0, start) + 1)
+
+    _database().scan(data, match_event_handler=on_match)
+    lines = []
+    for start in sorted(line_starts):
+        stop = data.find(b"\n", start)
+        if stop == -1:
+            stop = len(data)
+        lines.append(data[start:stop].decode("utf-8"))
+    return extract_all(lines)
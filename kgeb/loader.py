@@ -0,0 +1,45 @@
+"""Record-oriented document loading for the kgeb extractors.
+
+The corpus groups related lines into records separated by blank lines;
+the extractors here consume one record at a time.
+"""
+
+import mmap
+import re
+from functools import lru_cache
+
+_RECORD_SEP_RE = re.compile(rb"\n\s*\n")
+
+
+def iter_documents(path="documents.txt"):
+    """Yield the records of *path* lazily.
+
+    The file is memory-mapped and boundaries are located with a bytes
+    regex directly on the map, so no full-file string is materialized;
+    each record is decoded only when yielded.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file cannot be mapped
+            return
+        with mm:
+            start = 0
+            for sep in _RECORD_SEP_RE.finditer(mm):
+                record = mm[start : sep.start()].decode("utf-8").strip()
+                if record:
+                    yield record
+                start = sep.end()
+            tail = mm[start:].decode("utf-8").strip()
+            if tail:
+                yield tail
+
+
+@lru_cache(maxsize=None)
+def load_documents(path="documents.txt"):
+    """Return the blank-line-separated records of *path* as a tuple.
+
+    Cached per path for the life of the process, so pipelines that load
+    the corpus from several entry points parse it once.
+    """
+    return tuple(iter_documents(path))
@@ -0,0 +1,102 @@
+"""Whole-document relation extractor for the kgeb pipeline.
+
+Companion to :mod:`kgeb.extractor`: scans a full document string for
+relation phrasings and validates the endpoints against the already
+extracted entity names.
+"""
+
+try:  # linear-time RE2 engine when available
+    import re2 as re
+except ImportError:  # pragma: no cover - backtracking stdlib re fallback
+    import re
+
+from functools import lru_cache
+
+# No IGNORECASE on these: the verb phrases are fixed lowercase wording
+# and the endpoint classes already cover both cases, so the flag would
+# only double the match work per position.
+BELONGS_RE = re.compile(
+    r"([A-Za-z][A-Za-z\s\-]+?)\s+(?:belongs to|is in|member of)\s+"
+    r"(?:the\s+)?([A-Za-z &\-]+?)(?:\s+(?:department|team))?\."
+)
+
+USES_RE = re.compile(
+    r"([A-Za-z0-9\-]+)\s+(?:uses|relies on|adopts)\s+"
+    r"([A-Za-z0-9 &\-]+?)\."
+)
+
+OWNS_VERB_RE = re.compile(r"\s+(?:owns|sponsors|funds)\b")
+
+# Characters after the ownership verb within which the project mention
+# must appear; bounds the search instead of a lazy .*? with re.S that
+# can backtrack across the whole document.
+_OWNS_WINDOW = 200
+
+
+@lru_cache(maxsize=32)
+def _name_alternation(names):
+    """Compiled alternation over *names*, longest first, escaped."""
+    return re.compile(
+        "|".join(re.escape(n) for n in sorted(names, key=len, reverse=True))
+    )
+
+
+def _names(entities, etype):
+    """Set of names for one entity type, for O(1) endpoint checks."""
+    return {
+        it["name"] for it in entities.get(etype, []) if it.get("name")
+    }
+
+
+def extract_relations(doc, entities):
+    """Extract BelongsTo/Uses/OwnsProject relations from *doc*.
+
+    Each pattern scans the document once via ``finditer``; candidate
+    endpoints are validated against entity-name sets instead of nesting
+    a loop per Person x Company x Project combination.
+    """
+    person_names = _names(entities, "Person")
+    company_names = _names(entities, "Company")
+    project_names = _names(entities, "Project")
+    relations = {"BelongsTo": [], "Uses": [], "OwnsProject": []}
+    for m in BELONGS_RE.finditer(doc):
+        subject = m.group(1).strip()
+        if subject in person_names:
+            relations["BelongsTo"].append(
+                {"person": subject, "group": m.group(2).strip()}
+            )
+    for m in USES_RE.finditer(doc):
+        company = m.group(1)
+        if company in company_names:
+            relations["Uses"].append(
+                {"company": company, "technology": m.group(2).strip()}
+            )
+    if company_names and project_names:
+        # One pass over the company mentions; each hit probes only a
+        # bounded window after an adjacent ownership verb for the
+        # nearest known project name.
+        project_alt = _name_alternation(tuple(sorted(project_names)))
+        company_alt = _name_alternation(tuple(sorted(company_names)))
+        for m in company_alt.finditer(doc):
+            window = doc[m.end() : m.end() + _OWNS_WINDOW]
+            vm = OWNS_VERB_RE.match(window)
+            if vm is None:
+                continue
+            pm = project_alt.search(window, vm.end())
+            if pm is not None:
+                relations["OwnsProject"].append(
+                    {"company": m.group(0), "project": pm.group(0)}
+                )
+    return relations
+
+
+if __name__ == "__main__":
+    from pathlib import Path
+
+    from .extractor import extract_entities
+    from .gold_generator import _dump
+
+    doc = Path("documents.txt").read_text(encoding="utf-8")
+    relations = extract_relations(doc, extract_entities(doc))
+    _dump(relations, "extracted_doc_relations.json")
+    print({rtype: len(rels) for rtype, rels in relations.items()})
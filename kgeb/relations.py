@@ -0,0 +1,14 @@
+"""Shared relation-line patterns for the kgeb extractors."""
+
+try:  # linear-time RE2 engine when available
+    import re2 as re
+except ImportError:  # pragma: no cover - backtracking stdlib re fallback
+    import re
+
+# One alternation instead of three near-identical manages/leads/
+# oversees patterns matched serially: a single .match picks the verb
+# via the engine's prefix discrimination.
+MANAGEMENT_RE = re.compile(
+    r"^(?P<manager>[A-Za-z\-\s]+?) (?P<verb>manages|leads|oversees) "
+    r"(?P<count>\d+) projects?:\s*(?P<projects>[A-Za-z0-9\-,\s]+)\."
+)
@@ -0,0 +1,19 @@
+"""Build the optional Cython fast paths in place.
+
+    python setup.py build_ext --inplace
+
+The pure-Python implementations remain the fallback, so this build is
+never required to run the pipeline.
+"""
+
+from setuptools import setup
+
+from Cython.Build import cythonize
+
+setup(
+    name="kgeb-ext",
+    ext_modules=cythonize(
+        ["_entity_extract.pyx", "kgeb/_extractors.pyx"],
+        language_level=3,
+    ),
+)